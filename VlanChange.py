@@ -339,12 +339,12 @@ def test_switch_responsiveness(conn) -> float:
         print("Using moderate delay factor")
         return 2  # Use moderate delay if test fails
 
-def push_config_with_retry(conn, commands, max_retries=3):
+def push_config_with_retry(conn, commands, max_retries=3, cmd_verify=False):
     """Push configuration with retries for slow/laggy switches"""
     # Test switch responsiveness and set delay factor
     delay_factor = test_switch_responsiveness(conn)
     print(f"Using delay factor {delay_factor}x for this switch")
-    
+
     for attempt in range(max_retries):
         try:
             if attempt > 0:
@@ -352,40 +352,18 @@ def push_config_with_retry(conn, commands, max_retries=3):
                 wait_time = 10 * attempt * delay_factor
                 print(f"⏳ Waiting {wait_time}s before retry...")
                 time.sleep(wait_time)
-            
-            print("Entering configuration mode...")
-            conn.send_command(
-                "configure terminal",
-                expect_string=r"#",
-                read_timeout=60 * delay_factor,
-                cmd_verify=False,
-                strip_prompt=True,
-                strip_command=True
-            )
-            
-            if not conn.check_config_mode():
-                raise Exception("Failed to enter configuration mode")
-            
+
             print("Applying configuration commands...")
-            for cmd in commands:
-                conn.send_command_timing(
-                    cmd,
-                    read_timeout=60 * delay_factor,
-                    delay_factor=delay_factor,
-                    strip_prompt=True,
-                    strip_command=True
-                )
-                time.sleep(0.1)
-            
-            print("Exiting configuration mode...")
-            conn.send_command(
-                "end",
-                expect_string=r"#",
-                read_timeout=30,
-                strip_prompt=True,
-                strip_command=True
+            # One send_config_set enters config mode once, streams every
+            # line without waiting on per-command echo verification, and
+            # exits — a single prompt round trip instead of one per command
+            conn.send_config_set(
+                commands,
+                cmd_verify=cmd_verify,
+                exit_config_mode=True,
+                read_timeout=60 * delay_factor
             )
-            
+
             process_wait = max(2, 3 * delay_factor)
             print(f"⏳ Waiting {process_wait}s for switch to process changes...")
             time.sleep(process_wait)
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Network CI/CD Report Generator
+
+This script aggregates the artifacts produced by the network CI/CD pipeline
+(audit snapshots, test reports, logs) into a single summary for reviewers.
+
+Key Functions:
+1. Discovers audit/test artifacts from a CI artifacts directory
+2. Analyzes test results across pipeline runs
+3. Summarizes network coverage from audit snapshots
+4. Generates markdown and JSON reports
+"""
+
+import functools
+import gzip
+import hashlib
+import json
+import mmap
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import os
+import re
+import sys
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+from datetime import datetime
+
+# orjson parses/serializes JSON several times faster than stdlib json;
+# fall back to stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# jsonpatch materializes the incremental .patch.json snapshots the auditor
+# writes once a baseline exists; optional for the same reason as orjson
+try:
+    import jsonpatch
+except ImportError:
+    jsonpatch = None
+
+# numpy turns the duration statistics into single C-level reductions;
+# optional for the same reason as orjson
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ciso8601 parses ISO timestamps in C; otherwise use datetime.fromisoformat
+# directly, which accepts the trailing 'Z' natively on Python 3.11+, and only
+# fall back to the replace() shim on older interpreters
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    try:
+        datetime.fromisoformat('2000-01-01T00:00:00Z')
+        _parse_iso = datetime.fromisoformat
+    except ValueError:
+        def _parse_iso(value):
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Interned interface-type tags: every counter update and equality check on
+# these hashes/compares the same string object
+_IF_TEN_GIGABIT = sys.intern('TenGigabitEthernet')
+_IF_GIGABIT = sys.intern('GigabitEthernet')
+_IF_FAST = sys.intern('FastEthernet')
+_IF_PORT_CHANNEL = sys.intern('Port-channel')
+_IF_ETHERNET = sys.intern('Ethernet')
+_IF_OTHER = sys.intern('other')
+
+class NetworkReportGenerator:
+    """Main class for aggregating CI/CD artifacts into reports"""
+
+    # One compiled alternation classifies a filename in a single C-level scan;
+    # the name of the group that matched is the artifact category
+    _CATEGORY_RE = re.compile(
+        r'(?P<pre_audits>pre_(?:change|test)_audit)'
+        r'|(?P<post_audits>post_(?:change|test)_audit)'
+        r'|(?P<test_reports>test_report)'
+        r'|(?P<test_logs>test_results\.log)'
+        r'|(?P<comparison_reports>comparison_report)'
+    )
+
+    def __init__(self, artifacts_dir: str = "."):
+        """Initialize the generator with the CI artifacts directory"""
+        self.artifacts_dir = Path(artifacts_dir)
+        self._analysis_done = False
+        self.report_data = {
+            'generated': datetime.now().isoformat(),
+            'artifacts': {},
+            'test_analysis': {},
+            'network_coverage': {}
+        }
+
+    def discover_artifacts(self) -> Dict[str, List[str]]:
+        """Discover and categorize artifact files under the artifacts directory"""
+        print(f"🔍 Discovering artifacts in {self.artifacts_dir}...")
+
+        artifacts = {
+            'pre_audits': [],
+            'post_audits': [],
+            'test_reports': [],
+            'test_logs': [],
+            'comparison_reports': [],
+            'other': []
+        }
+
+        def _walk(dirpath):
+            # os.scandir yields DirEntry objects without building a Path per
+            # file, which keeps large CI artifact dumps cheap to traverse
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _walk(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+
+        if not self.artifacts_dir.is_dir():
+            print(f"⚠️ Artifacts directory not found: {self.artifacts_dir}")
+            self.report_data['artifacts'] = artifacts
+            return artifacts
+
+        for entry in _walk(str(self.artifacts_dir)):
+            # Every categorized artifact is a .json/.json.gz/.md/.log file;
+            # skip the substring rules for anything else (pcaps, binaries, ...)
+            name = entry.name.lower()
+            ext = name.rpartition('.')[2]
+            if ext == 'gz' and name.endswith('.json.gz'):
+                ext = 'json'
+            if ext not in ('json', 'md', 'log'):
+                artifacts['other'].append(entry.path)
+                continue
+            m = self._CATEGORY_RE.search(name)
+            category = m.lastgroup if m else 'other'
+            if category == 'test_reports':
+                # Tag the kind here so the analysis loop doesn't re-derive
+                # the suffix per file
+                artifacts[category].append((entry.path, ext))
+            else:
+                artifacts[category].append(entry.path)
+
+        total = sum(len(files) for files in artifacts.values())
+        print(f"  📦 Found {total} artifact files")
+
+        self.report_data['artifacts'] = artifacts
+        return artifacts
+
+    def analyze_test_results(self) -> Dict[str, Any]:
+        """Analyze test reports and summarize pass/fail results"""
+        print("📊 Analyzing test results...")
+
+        analysis = {
+            'total_tests': 0,
+            'tests_passed': 0,
+            'tests_failed': 0,
+            'devices_tested': set(),
+            'interfaces_tested': set(),
+            'vlans_tested': set(),
+            'test_durations': [],
+            'common_issues': []
+        }
+
+        all_errors = []
+        all_warnings = []
+
+        for partial in _map_parsers(_parse_test_report,
+                                    self.report_data['artifacts']['test_reports']):
+            analysis['total_tests'] += partial['total_tests']
+            analysis['tests_passed'] += partial['tests_passed']
+            analysis['tests_failed'] += partial['tests_failed']
+            analysis['devices_tested'].update(partial['devices_tested'])
+            analysis['interfaces_tested'].update(partial['interfaces_tested'])
+            analysis['vlans_tested'].update(partial['vlans_tested'])
+            analysis['test_durations'].extend(partial['test_durations'])
+            all_errors.extend(partial['errors'])
+            all_warnings.extend(partial['warnings'])
+
+        if analysis['test_durations']:
+            durations = analysis['test_durations']
+            if np is not None:
+                arr = np.fromiter(durations, dtype=np.float64, count=len(durations))
+                analysis['duration_stats'] = {
+                    'average': float(arr.mean()),
+                    'min': float(arr.min()),
+                    'max': float(arr.max())
+                }
+            else:
+                analysis['duration_stats'] = {
+                    'average': sum(durations) / len(durations),
+                    'min': min(durations),
+                    'max': max(durations)
+                }
+
+        analysis['common_issues'] = self._find_common_issues(chain(all_errors, all_warnings))
+
+        # Convert sets to sorted lists for stable report output
+        analysis['devices_tested'] = sorted(analysis['devices_tested'])
+        analysis['interfaces_tested'] = sorted(analysis['interfaces_tested'])
+        analysis['vlans_tested'] = sorted(analysis['vlans_tested'])
+
+        print(f"  ✅ {analysis['tests_passed']} passed, ❌ {analysis['tests_failed']} failed")
+
+        self.report_data['test_analysis'] = analysis
+        return analysis
+
+    def analyze_network_coverage(self) -> Dict[str, Any]:
+        """Summarize device/port/VLAN coverage from pre-change audit snapshots"""
+        print("🌐 Analyzing network coverage...")
+
+        coverage = {
+            'devices_audited': 0,
+            'total_ports': 0,
+            'vlan_distribution': defaultdict(int),
+            'interface_types': defaultdict(int),
+            'port_utilization': defaultdict(int),
+            'device_coverage': {}
+        }
+
+        for partial in _map_parsers(_parse_audit_file,
+                                    self.report_data['artifacts']['pre_audits']):
+            coverage['devices_audited'] += partial['devices_audited']
+            coverage['total_ports'] += partial['total_ports']
+            for key in ('vlan_distribution', 'interface_types', 'port_utilization'):
+                counts = coverage[key]
+                for value, count in partial[key].items():
+                    counts[value] += count
+            coverage['device_coverage'].update(partial['device_coverage'])
+
+        # Back to plain dicts before the coverage data is serialized
+        for key in ('vlan_distribution', 'interface_types', 'port_utilization'):
+            coverage[key] = dict(coverage[key])
+
+        print(f"  📊 {coverage['devices_audited']} devices, {coverage['total_ports']} ports")
+
+        self.report_data['network_coverage'] = coverage
+        return coverage
+
+    def _ensure_analysis(self):
+        """Discover and analyze artifacts at most once per generator instance"""
+        if not self._analysis_done:
+            self.discover_artifacts()
+            self.analyze_test_results()
+            self.analyze_network_coverage()
+            self._analysis_done = True
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _categorize_issue(issue: str) -> str:
+        """Categorize an error/warning message by keyword"""
+        issue_lower = issue.lower()
+        if 'connect' in issue_lower or 'unreachable' in issue_lower:
+            return 'connectivity'
+        elif 'auth' in issue_lower or 'password' in issue_lower or 'credential' in issue_lower:
+            return 'authentication'
+        elif 'timeout' in issue_lower or 'timed out' in issue_lower:
+            return 'timeout'
+        elif 'config' in issue_lower or 'vlan' in issue_lower:
+            return 'configuration'
+        elif 'valid' in issue_lower:
+            return 'validation'
+        return 'other'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_interface_type(interface_name: str) -> str:
+        """Map an interface name to its hardware type"""
+        if interface_name.startswith('TenGigabitEthernet') or interface_name.startswith('Te'):
+            return _IF_TEN_GIGABIT
+        elif interface_name.startswith('GigabitEthernet') or interface_name.startswith('Gi'):
+            return _IF_GIGABIT
+        elif interface_name.startswith('FastEthernet') or interface_name.startswith('Fa'):
+            return _IF_FAST
+        elif interface_name.startswith('Port-channel') or interface_name.startswith('Po'):
+            return _IF_PORT_CHANNEL
+        elif interface_name.startswith('Ethernet') or interface_name.startswith('Et'):
+            return _IF_ETHERNET
+        return _IF_OTHER
+
+    def _find_common_issues(self, all_issues: Iterable[str]) -> List[Dict[str, Any]]:
+        """Find the most frequently recurring errors/warnings"""
+        issue_counts = Counter(issue.lower().strip() for issue in all_issues)
+
+        common = []
+        # most_common(10) uses a heap partial sort: O(K log 10) over K
+        # distinct issues rather than sorting them all
+        for issue, count in issue_counts.most_common(10):
+            if count > 1:
+                common.append({
+                    'issue': issue,
+                    'count': count,
+                    'category': self._categorize_issue(issue)
+                })
+        return common
+
+    def generate_executive_summary(self) -> str:
+        """Build a short pass/fail summary section"""
+        analysis = self.report_data.get('test_analysis', {})
+        coverage = self.report_data.get('network_coverage', {})
+
+        total = analysis.get('total_tests', 0)
+        passed = analysis.get('tests_passed', 0)
+        pass_rate = (passed / total * 100) if total else 0.0
+
+        lines = [
+            "## Executive Summary",
+            "",
+            f"- **Total Tests**: {total}",
+            f"- **Pass Rate**: {pass_rate:.1f}%",
+            f"- **Devices Audited**: {coverage.get('devices_audited', 0)}",
+            f"- **Total Ports**: {coverage.get('total_ports', 0)}"
+        ]
+        return '\n'.join(lines)
+
+    def generate_detailed_report(self, output_file: str = None) -> str:
+        """Generate a full markdown report from the discovered artifacts"""
+        if not output_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"network_ci_report_{timestamp}.md"
+
+        self._ensure_analysis()
+
+        # Stream the report straight to disk instead of accumulating every
+        # line in memory and joining at the end
+        with open(output_file, 'w', buffering=1 << 16) as f:
+            emit = f.write
+            emit("# Network CI/CD Pipeline Report\n")
+            emit("\n")
+            emit(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            emit("\n")
+            emit(self.generate_executive_summary() + "\n")
+            emit("\n")
+
+            analysis = self.report_data['test_analysis']
+            emit("## Test Results\n")
+            emit("\n")
+            emit(f"- **Total Tests**: {analysis['total_tests']}\n")
+            emit(f"- **Passed**: {analysis['tests_passed']}\n")
+            emit(f"- **Failed**: {analysis['tests_failed']}\n")
+            if 'duration_stats' in analysis:
+                stats = analysis['duration_stats']
+                emit(f"- **Average Duration**: {stats['average']:.1f}s\n")
+                emit(f"- **Min/Max Duration**: {stats['min']:.1f}s / {stats['max']:.1f}s\n")
+            emit("\n")
+
+            coverage = self.report_data['network_coverage']
+            total_ports = coverage['total_ports']
+
+            if coverage['vlan_distribution']:
+                emit("## VLAN Distribution\n")
+                emit("\n")
+                emit("| VLAN | Ports | Percentage |\n")
+                emit("|------|-------|------------|\n")
+                sorted_vlans = sorted(coverage['vlan_distribution'].items(),
+                                      key=lambda item: item[1], reverse=True)
+                f.writelines(
+                    f"| {vlan} | {count} | {(count / total_ports * 100 if total_ports else 0):.1f}% |\n"
+                    for vlan, count in sorted_vlans[:10]
+                )
+                emit("\n")
+
+            if coverage['device_coverage']:
+                emit("## Device Breakdown\n")
+                emit("\n")
+                emit("| Device | Hostname | Ports | VLANs |\n")
+                emit("|--------|----------|-------|-------|\n")
+                f.writelines(
+                    f"| {device_name} | {device_info['hostname']} | "
+                    f"{device_info['port_count']} | {len(device_info['vlans_used'])} |\n"
+                    for device_name, device_info in sorted(coverage['device_coverage'].items())
+                )
+                emit("\n")
+
+            if analysis['common_issues']:
+                emit("## Common Issues\n")
+                emit("\n")
+                f.writelines(
+                    f"- **{item['category']}** ({item['count']}x): {item['issue']}\n"
+                    for item in analysis['common_issues']
+                )
+                emit("\n")
+
+        print(f"📄 Detailed report generated: {output_file}")
+        return output_file
+
+    def generate_json_report(self, output_file: str = None) -> str:
+        """Generate a machine-readable JSON report"""
+        if not output_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"network_ci_report_{timestamp}.json"
+
+        self._ensure_analysis()
+
+        # Serialize to one bytes buffer and write it in a single call; the
+        # stdlib fallback avoids json.dump's chunked streaming writer
+        if orjson:
+            payload = orjson.dumps(self.report_data,
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+                                   default=_json_default)
+        else:
+            payload = (json.dumps(self.report_data, indent=2,
+                                  default=_json_default) + '\n').encode()
+        with open(output_file, 'wb') as f:
+            f.write(payload)
+
+        print(f"📄 JSON report generated: {output_file}")
+        return output_file
+
+def _json_default(obj):
+    """Serialization fallback for values the JSON encoder can't handle natively"""
+    if isinstance(obj, set):
+        return list(obj)
+    return str(obj)
+
+# UTF-8 encodings of the markdown pass/fail markers, searched on raw bytes
+_PASSED_MARKER = '✅ PASSED'.encode()
+_FAILED_MARKER = '❌ FAILED'.encode()
+
+# (report field, analysis set) pairs harvested from every test report
+_CFG_FIELDS = (
+    ('target_device', 'devices_tested'),
+    ('target_interface', 'interfaces_tested'),
+    ('target_vlan', 'vlans_tested'),
+)
+
+def _parse_test_report(report_item) -> Dict[str, Any]:
+    """Parse a single (path, kind) test report into a partial analysis (pickleable)"""
+    path_str, kind = report_item
+    partial = {
+        'total_tests': 0,
+        'tests_passed': 0,
+        'tests_failed': 0,
+        'devices_tested': set(),
+        'interfaces_tested': set(),
+        'vlans_tested': set(),
+        'test_durations': [],
+        'errors': [],
+        'warnings': []
+    }
+
+    report_file = path_str
+    try:
+        if kind == 'json':
+            with open(report_file, 'rb') as f:
+                raw = f.read()
+            test_data = orjson.loads(raw) if orjson else json.loads(raw)
+
+            partial['total_tests'] = 1
+            results = test_data.get('test_results', test_data)
+
+            if results.get('success'):
+                partial['tests_passed'] = 1
+            else:
+                partial['tests_failed'] = 1
+
+            for key, set_key in _CFG_FIELDS:
+                value = results.get(key)
+                if value:
+                    partial[set_key].add(str(value) if set_key == 'vlans_tested' else value)
+
+            start_time = results.get('start_time')
+            end_time = results.get('end_time')
+            if start_time and end_time:
+                start = _parse_iso(start_time)
+                end = _parse_iso(end_time)
+                partial['test_durations'].append((end - start).total_seconds())
+
+            partial['errors'] = results.get('errors', [])
+            partial['warnings'] = results.get('warnings', [])
+
+        elif kind == 'md':
+            partial['total_tests'] = 1
+            # mmap the report and search the marker bytes directly; no
+            # decoded copy of the whole file is ever allocated
+            with open(report_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if mm.find(_PASSED_MARKER) != -1:
+                            partial['tests_passed'] = 1
+                        elif mm.find(_FAILED_MARKER) != -1:
+                            partial['tests_failed'] = 1
+
+    except Exception as e:
+        print(f"  ⚠️ Could not parse {report_file}: {e}")
+
+    return partial
+
+def _state_hash(flat_device_dict: Dict[str, Any]) -> str:
+    """Content hash of a flattened device state (mirrors the auditor's)"""
+    normalized = {k: v for k, v in flat_device_dict.items() if k != 'timestamp'}
+    if orjson is not None:
+        payload = orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(normalized, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _resolve_audit_data(audit_data: Any, audit_path: Path) -> Dict[str, Any]:
+    """Materialize a patch- or ref-format audit snapshot via its baseline"""
+    loads = orjson.loads if orjson else json.loads
+    if isinstance(audit_data, list):
+        # RFC 6902 patch against baseline.json in the same directory
+        if jsonpatch is None:
+            raise RuntimeError("audit is a patch but jsonpatch is not installed")
+        baseline = loads((audit_path.parent / "baseline.json").read_bytes())
+        return jsonpatch.JsonPatch(audit_data).apply(baseline)
+
+    # Devices unchanged since the previous audit are stored as {"ref": hash}
+    # pointers. The auditor's content-addressed audit_states/ store is
+    # authoritative; the baseline only holds the *latest* state, so its
+    # entry is trusted for an older ref only when its hash still matches
+    baseline = None
+    resolved = {}
+    for device_name, entry in audit_data.items():
+        if isinstance(entry, dict) and set(entry) == {'ref'}:
+            state_path = audit_path.parent / "audit_states" / f"{entry['ref']}.json"
+            try:
+                resolved[device_name] = loads(state_path.read_bytes())
+                continue
+            except (FileNotFoundError, ValueError):
+                pass
+            if baseline is None:
+                baseline = loads((audit_path.parent / "baseline.json").read_bytes())
+            full = baseline.get(device_name)
+            if full is not None and _state_hash(full) == entry['ref']:
+                resolved[device_name] = full
+            else:
+                print(f"  ⚠️ {device_name}: ref {entry['ref']} has no stored "
+                      f"state and the baseline no longer matches it")
+                resolved[device_name] = entry
+        else:
+            resolved[device_name] = entry
+    return resolved
+
+def _parse_audit_file(path_str: str) -> Dict[str, Any]:
+    """Parse a single audit snapshot into partial coverage data (pickleable)"""
+    partial = {
+        'devices_audited': 0,
+        'total_ports': 0,
+        'vlan_distribution': defaultdict(int),
+        'interface_types': defaultdict(int),
+        'port_utilization': defaultdict(int),
+        'device_coverage': {}
+    }
+
+    audit_path = Path(path_str)
+    name = audit_path.name
+    if not (name.endswith('.json') or name.endswith('.json.gz')):
+        return partial
+
+    try:
+        # The auditor gzips full snapshots (.json.gz); patches and legacy
+        # snapshots stay plain .json
+        opener = gzip.open if name.endswith('.gz') else open
+        with opener(audit_path, 'rb') as f:
+            raw = f.read()
+        audit_data = orjson.loads(raw) if orjson else json.loads(raw)
+        audit_data = _resolve_audit_data(audit_data, audit_path)
+    except Exception as e:
+        print(f"  ⚠️ Could not parse {audit_path}: {e}")
+        return partial
+
+    for device_name, device_state in audit_data.items():
+        partial['devices_audited'] += 1
+        ports = device_state.get('ports', {})
+
+        device_info = {
+            'hostname': device_state.get('hostname', device_name),
+            'port_count': len(ports),
+            'vlans_used': set(),
+            'interface_types': defaultdict(int)
+        }
+
+        for port_name, port_config in ports.items():
+            partial['total_ports'] += 1
+
+            vlan = str(port_config.get('access_vlan', '1'))
+            partial['vlan_distribution'][vlan] += 1
+            device_info['vlans_used'].add(vlan)
+
+            interface_type = NetworkReportGenerator._get_interface_type(port_name)
+            partial['interface_types'][interface_type] += 1
+            device_info['interface_types'][interface_type] += 1
+
+            status = port_config.get('operational_status', 'unknown')
+            partial['port_utilization'][status] += 1
+
+        device_info['interface_types'] = dict(device_info['interface_types'])
+        partial['device_coverage'][device_name] = device_info
+
+    return partial
+
+def _map_parsers(parser, paths):
+    """Map a per-file parser over artifact paths, in parallel for large batches"""
+    if len(paths) > 4:
+        with ProcessPoolExecutor() as ex:
+            yield from ex.map(parser, paths, chunksize=16)
+    else:
+        yield from map(parser, paths)
+
+def main():
+    """Main function for command-line usage"""
+    parser = argparse.ArgumentParser(description="Network CI/CD Report Generator")
+    parser.add_argument("--artifacts-dir", default=".",
+                       help="Directory containing CI artifacts")
+    parser.add_argument("--output", help="Output file basename for generated reports")
+    parser.add_argument("--summary-only", action="store_true",
+                       help="Print the executive summary and exit")
+
+    args = parser.parse_args()
+
+    generator = NetworkReportGenerator(args.artifacts_dir)
+
+    if args.summary_only:
+        generator._ensure_analysis()
+        print(f"\n{generator.generate_executive_summary()}")
+        return
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    basename = args.output or f"network_ci_report_{timestamp}"
+    md_file = generator.generate_detailed_report(f"{basename}.md")
+    json_file = generator.generate_json_report(f"{basename}.json")
+
+    print(f"\n✅ Report generation completed")
+    print(f"📁 Markdown: {md_file}")
+    print(f"📁 JSON: {json_file}")
+
+if __name__ == "__main__":
+    main()
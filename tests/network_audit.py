@@ -13,22 +13,83 @@ Key Functions:
 5. Validates post-change state against expectations
 """
 
+import gzip
+import hashlib
 import json
 import re
-import yaml
 import sys
 import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
 
+try:
+    import orjson  # optional: Rust-backed JSON, much faster than stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import jsonpatch  # optional: RFC 6902 diffs for incremental audit snapshots
+except ImportError:
+    jsonpatch = None
+
 # Add parent directory to path to import VlanChange modules
 sys.path.append(str(Path(__file__).parent.parent))
 from VlanChange import connect_with_fallback, get_po_members
 
-@dataclass
+# Longest prefixes first so TenGigabitEthernet is not matched as Ethernet
+_IFACE_SHORT_MAP = {
+    'TenGigabitEthernet': 'Te',
+    'GigabitEthernet': 'Gi',
+    'FastEthernet': 'Fa',
+    'Ethernet': 'Et',
+}
+
+# Patterns used inside per-line parse loops, compiled once at import so the
+# hot loops skip the re cache lookup entirely
+_RE_ACCESS_VLAN = re.compile(r"Access Mode VLAN:\s*(\d+)")
+_RE_VOICE_VLAN = re.compile(r"Voice VLAN:\s*(\d+|none)", re.I)
+# First Po<number> on each non-header line of 'show etherchannel summary',
+# pulled out of the whole blob in one findall
+_RE_PO_LINE = re.compile(r"(?m)^(?!Flags:|Group).*?\b(Po\d+)\b")
+_RE_PHYS_IFACE = re.compile(r"^(?:TenGigabitEthernet|GigabitEthernet|FastEthernet|Ethernet|Te|Gi|Fa|Et)\d")
+_RE_SKIP_IFACE = re.compile(r"(?i)(vlan|loopback|tunnel|mgmt)")
+
+# VLAN table rows start with the numeric ID; one C-level startswith call
+# rejects headers and Ports continuation lines
+_DIGIT_PREFIX = tuple("0123456789")
+
+def _open_audit(path, mode: str):
+    """Open an audit artifact, transparently gzipping .gz paths
+
+    Level 3 compresses the highly repetitive audit JSON several-fold for a
+    few milliseconds of CPU.
+    """
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode, compresslevel=3)
+    return open(path, mode)
+
+def _state_hash(flat_device_dict: Dict[str, Any]) -> str:
+    """Content hash of a flattened device state, ignoring the capture timestamp"""
+    normalized = {k: v for k, v in flat_device_dict.items() if k != 'timestamp'}
+    if orjson is not None:
+        payload = orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(normalized, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _short_interface_name(interface: str) -> str:
+    """Collapse a full interface name to its short form (GigabitEthernet0/1 -> Gi0/1)"""
+    for full, short in _IFACE_SHORT_MAP.items():
+        if interface.startswith(full):
+            return short + interface[len(full):]
+    return interface
+
+@dataclass(slots=True)
 class PortConfig:
     """Data class to store port configuration details"""
     interface: str
@@ -44,7 +105,7 @@ class PortConfig:
     cdp_neighbor: Optional[str] = None
     portchannel_member: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     """Data class to store complete device state"""
     hostname: str
@@ -55,17 +116,189 @@ class DeviceState:
     vlans: List[Dict[str, str]]
     portchannels: Dict[str, List[str]]
 
+    def flat_vlan_map(self, device_key: Optional[str] = None) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """Flatten ports to {(device, interface): (access_vlan, mode)}
+
+        Lets callers diff two audits with one C-level dict comparison per
+        key instead of walking PortConfig attributes port by port.
+        """
+        key = device_key if device_key is not None else self.hostname
+        return {
+            (key, interface): (port.access_vlan, port.mode)
+            for interface, port in self.ports.items()
+        }
+
+# Chassis with at least this many interfaces get their ports parsed in the
+# shared per-run process pool; below it the pickling/IPC overhead costs
+# more than the parse itself (each port is microseconds of string work)
+_PARALLEL_PARSE_THRESHOLD = 256
+
+def _parse_port_config(interface: str, switchport_output: str,
+                       status_entry: Optional[Tuple[str, str]],
+                       config_output: str) -> PortConfig:
+    """Parse one interface's batched output into a PortConfig
+
+    Pure function over strings (module-level so it pickles cleanly into a
+    process pool).
+    """
+    port_config = PortConfig(
+        interface=interface,
+        admin_status="unknown",
+        operational_status="unknown",
+        access_vlan="1",
+        voice_vlan="none",
+        mode="unknown",
+        portfast=False,
+        description="",
+        speed="auto",
+        duplex="auto"
+    )
+
+    # Categorical fields are interned: values like "access", "connected" or
+    # "auto" repeat across every port, so each unique string is stored once
+    # and later equality checks reduce to pointer comparisons
+
+    # split('\n') is cheaper than splitlines() here: it skips the universal
+    # newline scan and the strip()/split() below swallow any stray \r
+    # Parse switchport output
+    for line in switchport_output.split('\n'):
+        line = line.strip()
+        if "Administrative Mode:" in line:
+            port_config.mode = sys.intern(line.split()[-1])
+        elif "Access Mode VLAN:" in line:
+            # Handle formats like: "Access Mode VLAN: 10 (VLAN0010)"
+            m = _RE_ACCESS_VLAN.search(line)
+            if m:
+                port_config.access_vlan = sys.intern(m.group(1))
+            else:
+                # Fallback to last token
+                port_config.access_vlan = sys.intern(line.split()[-1])
+        elif "Voice VLAN:" in line:
+            m = _RE_VOICE_VLAN.search(line)
+            if m:
+                port_config.voice_vlan = sys.intern(m.group(1).lower())
+            else:
+                port_config.voice_vlan = sys.intern(line.split()[-1])
+
+    if status_entry:
+        # status_entry is (status, vlan); 'disabled' is the only status the
+        # table reports for an administratively downed port
+        status = status_entry[0]
+        port_config.operational_status = sys.intern(status)
+        port_config.admin_status = sys.intern('disabled' if status == 'disabled' else 'enabled')
+
+    # Parse running config section for this interface
+    for line in config_output.split('\n'):
+        line = line.strip()
+        if "description " in line:
+            port_config.description = line.replace("description ", "")
+        elif "spanning-tree portfast" in line:
+            port_config.portfast = True
+        elif "speed " in line:
+            port_config.speed = sys.intern(line.split()[-1])
+        elif "duplex " in line:
+            port_config.duplex = sys.intern(line.split()[-1])
+
+    return port_config
+
+def _parse_port_config_args(args: Tuple) -> PortConfig:
+    """Unpack helper so executor.map can chunk _parse_port_config calls"""
+    return _parse_port_config(*args)
+
+class ConnectionPool:
+    """Reuse netmiko SSH sessions keyed by (host, username)
+
+    Opening an SSH session costs a full handshake per device; audits that
+    run back to back (pre-change and post-change) pay it twice. The pool
+    hands back the existing session while it is still alive and younger
+    than the idle timeout (CONNECTION_POOL_IDLE_TIMEOUT, seconds).
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = None):
+        if idle_timeout is None:
+            idle_timeout = float(os.getenv('CONNECTION_POOL_IDLE_TIMEOUT', '300'))
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._connections: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+
+    def get(self, host: str, username: str, password: str):
+        """Return a live pooled connection, or open a fresh one"""
+        key = (host, username)
+        with self._lock:
+            entry = self._connections.pop(key, None)
+        if entry:
+            conn, last_used = entry
+            if time.time() - last_used < self.idle_timeout:
+                try:
+                    if conn.is_alive():
+                        return conn
+                except Exception:
+                    pass
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
+        conn, _, _ = connect_with_fallback(host, username, password)
+        return conn
+
+    def release(self, host: str, username: str, conn) -> None:
+        """Return a connection to the pool for reuse"""
+        if not conn:
+            return
+        key = (host, username)
+        with self._lock:
+            displaced = self._connections.get(key)
+            self._connections[key] = (conn, time.time())
+        if displaced:
+            try:
+                displaced[0].disconnect()
+            except Exception:
+                pass
+
+    def send_keepalives(self) -> None:
+        """Nudge every checked-in session so idle timeouts don't reap them
+
+        Runs under the pool lock so no session can be checked out mid-nudge,
+        and uses find_prompt() so the echoed prompt is consumed instead of
+        lingering in the channel for the next send_command to trip over.
+        get() and release() block for the duration; the nudges are quick
+        and the keepalive timer fires well outside the hot path.
+        """
+        with self._lock:
+            now = time.time()
+            for key, (conn, _) in list(self._connections.items()):
+                try:
+                    conn.find_prompt()
+                    self._connections[key] = (conn, now)
+                except Exception:
+                    pass
+
+    def close_all(self) -> None:
+        """Disconnect every pooled session"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn, _ in connections:
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
+
 class NetworkAuditor:
     """Main class for network auditing operations"""
-    
+
     def __init__(self, devices_file: str = "inventory/devices.yml"):
         """Initialize the auditor with device inventory"""
         self.devices_file = Path(devices_file)
         self.devices = self._load_devices()
         self.credentials = self._load_credentials()
+        self.pool = ConnectionPool()
         
     def _load_devices(self) -> Dict[str, Dict[str, str]]:
         """Load device inventory from YAML file"""
+        # Deferred so importing this module doesn't pay the yaml import;
+        # only code paths that actually construct an auditor need it
+        import yaml
         try:
             with open(self.devices_file, 'r') as f:
                 data = yaml.safe_load(f)
@@ -91,94 +324,80 @@ class NetworkAuditor:
             
         return username, password
     
-    def get_port_config(self, conn, interface: str) -> PortConfig:
-        """Extract detailed configuration for a specific port"""
-        print(f"  📋 Gathering config for {interface}...")
-        
-        # Get switchport information
-        switchport_output = conn.send_command(
-            f"show interface {interface} switchport",
-            read_timeout=30,
-            cmd_verify=False
-        )
-        
-        # Get interface status
-        status_output = conn.send_command(
-            f"show interface {interface} status",
-            read_timeout=30,
-            cmd_verify=False
-        )
-        
-        # Get running config for the interface
-        config_output = conn.send_command(
-            f"show running-config interface {interface}",
-            read_timeout=30,
-            cmd_verify=False
-        )
-        
-        # Parse the outputs
-        port_config = PortConfig(
-            interface=interface,
-            admin_status="unknown",
-            operational_status="unknown", 
-            access_vlan="1",
-            voice_vlan="none",
-            mode="unknown",
-            portfast=False,
-            description="",
-            speed="auto",
-            duplex="auto"
-        )
-        
-        # Parse switchport output
-        for line in switchport_output.splitlines():
-            line = line.strip()
-            if "Administrative Mode:" in line:
-                port_config.mode = line.split()[-1]
-            elif "Access Mode VLAN:" in line:
-                # Handle formats like: "Access Mode VLAN: 10 (VLAN0010)"
-                m = re.search(r"Access Mode VLAN:\s*(\d+)", line)
-                if m:
-                    port_config.access_vlan = m.group(1)
-                else:
-                    # Fallback to last token
-                    port_config.access_vlan = line.split()[-1]
-            elif "Voice VLAN:" in line:
-                m = re.search(r"Voice VLAN:\s*(\d+|none)", line, re.I)
-                if m:
-                    port_config.voice_vlan = m.group(1).lower()
-                else:
-                    port_config.voice_vlan = line.split()[-1]
-        
-        # Parse status output
-        for line in status_output.splitlines():
-            if interface in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    port_config.operational_status = parts[1] if len(parts) > 1 else "unknown"
-                    port_config.admin_status = parts[2] if len(parts) > 2 else "unknown"
-                break
-        
-        # Parse running config
-        in_interface = False
+    def _split_config_by_interface(self, config_output: str) -> Dict[str, str]:
+        """Slice full running-config output into per-interface blocks"""
+        sections = {}
+        current = None
+        lines = []
         for line in config_output.splitlines():
-            line = line.strip()
-            if f"interface {interface}" in line:
-                in_interface = True
+            if line.startswith("interface "):
+                if current:
+                    sections[current] = "\n".join(lines)
+                current = line.split(None, 1)[1].strip()
+                lines = []
+            elif current is not None:
+                if line.startswith("!"):
+                    sections[current] = "\n".join(lines)
+                    current = None
+                    lines = []
+                else:
+                    lines.append(line)
+        if current:
+            sections[current] = "\n".join(lines)
+        return sections
+
+    def _split_switchport_by_interface(self, switchport_output: str) -> Dict[str, str]:
+        """Slice 'show interfaces switchport' output into per-interface blocks"""
+        sections = {}
+        current = None
+        lines = []
+        for line in switchport_output.splitlines():
+            if line.startswith("Name: "):
+                if current:
+                    sections[current] = "\n".join(lines)
+                current = line.split()[-1]
+                lines = []
+            elif current is not None:
+                lines.append(line)
+        if current:
+            sections[current] = "\n".join(lines)
+        return sections
+
+    def _parse_status_table(self, status_output: str) -> Dict[str, Tuple[str, str]]:
+        """Index 'show interfaces status' output by interface in one pass
+
+        Values are (status, vlan). The table's columns are
+        'Port Name Status Vlan Duplex Speed Type' and Name can contain
+        spaces or be empty, so fields are sliced at the header's column
+        offsets when a header is present; headerless output falls back to
+        whitespace tokens, which assumes no Name column is populated.
+        """
+        status_map = {}
+        status_col = vlan_col = vlan_end = None
+        for line in status_output.split('\n'):
+            if status_col is None and 'Status' in line and 'Vlan' in line \
+                    and line.lstrip().startswith('Port'):
+                status_col = line.index('Status')
+                vlan_col = line.index('Vlan')
+                vlan_end = line.index('Duplex') if 'Duplex' in line else None
                 continue
-            elif line.startswith("interface ") and in_interface:
-                break
-            elif in_interface:
-                if "description " in line:
-                    port_config.description = line.replace("description ", "")
-                elif "spanning-tree portfast" in line:
-                    port_config.portfast = True
-                elif "speed " in line:
-                    port_config.speed = line.split()[-1]
-                elif "duplex " in line:
-                    port_config.duplex = line.split()[-1]
-        
-        return port_config
+            parts = line.split()
+            if len(parts) < 3 or not _RE_PHYS_IFACE.match(parts[0]):
+                continue
+            if status_col is not None and len(line) > vlan_col:
+                status = line[status_col:vlan_col].strip()
+                vlan_tokens = (line[vlan_col:vlan_end] if vlan_end else line[vlan_col:]).split()
+                if status and vlan_tokens:
+                    status_map[parts[0]] = (status, vlan_tokens[0])
+            else:
+                status_map[parts[0]] = (parts[1], parts[2])
+        return status_map
+
+    def get_port_config(self, interface: str, switchport_output: str,
+                        status_entry: Optional[Tuple[str, str]], config_output: str) -> PortConfig:
+        """Extract detailed configuration for a specific port from batched device output"""
+        print(f"  📋 Gathering config for {interface}...")
+        return _parse_port_config(interface, switchport_output, status_entry, config_output)
     
     def get_device_ports(self, conn) -> List[str]:
         """Get list of all ports on the device"""
@@ -191,26 +410,22 @@ class NetworkAuditor:
             "show interface summary"
         ]
         
-        interfaces = []
+        interfaces = set()
         for cmd in commands:
             try:
                 output = conn.send_command(cmd, read_timeout=30, cmd_verify=False)
-                
+
                 for line in output.splitlines():
-                    # Look for interface names (GigabitEthernet, FastEthernet, etc.)
-                    if any(prefix in line for prefix in ['GigabitEthernet', 'FastEthernet', 'TenGigabitEthernet', 'Ethernet']):
-                        parts = line.split()
-                        if parts:
-                            interface = parts[0]
-                            # Avoid management interfaces and virtual interfaces
-                            if not any(skip in interface.lower() for skip in ['vlan', 'loopback', 'tunnel', 'mgmt']):
-                                if interface not in interfaces:
-                                    interfaces.append(interface)
+                    parts = line.split()
+                    # One anchored match covers every physical-interface prefix;
+                    # the skip pattern drops management and virtual interfaces
+                    if parts and _RE_PHYS_IFACE.match(parts[0]) and not _RE_SKIP_IFACE.search(parts[0]):
+                        interfaces.add(parts[0])
                 break
             except Exception as e:
                 print(f"  ⚠️ Command '{cmd}' failed: {e}")
                 continue
-        
+
         return sorted(interfaces)
     
     def get_device_vlans(self, conn) -> List[Dict[str, str]]:
@@ -218,12 +433,28 @@ class NetworkAuditor:
         print("  🏷️ Gathering VLAN information...")
         
         try:
-            output = conn.send_command("show vlan brief", read_timeout=30, cmd_verify=False)
+            # TextFSM templates shipped alongside netmiko parse the table in
+            # C-backed code and hand back dicts directly; when the library or
+            # template is missing netmiko returns the raw string, so the
+            # manual parser below stays as the fallback
+            output = conn.send_command(
+                "show vlan brief", read_timeout=30, cmd_verify=False, use_textfsm=True
+            )
+            if isinstance(output, list):
+                return [
+                    {
+                        'id': str(entry.get('vlan_id', '')),
+                        'name': entry.get('name', ''),
+                        'status': entry.get('status', 'unknown')
+                    }
+                    for entry in output
+                ]
+
             vlans = []
-            
+
             for line in output.splitlines():
                 line = line.strip()
-                if line and line[0].isdigit():
+                if line.startswith(_DIGIT_PREFIX):
                     parts = line.split()
                     if len(parts) >= 2:
                         vlans.append({
@@ -244,32 +475,40 @@ class NetworkAuditor:
         try:
             output = conn.send_command("show etherchannel summary", read_timeout=30, cmd_verify=False)
             portchannels = {}
-            
-            for line in output.splitlines():
-                line = line.strip()
-                # Look only at lines that actually reference a Po<number>
-                if re.search(r"\bPo\d+\b", line) and not line.startswith(('Flags:', 'Group')):
-                    parts = line.split()
-                    for part in parts:
-                        if re.match(r'^Po\d+$', part):
-                            po_name = part
-                            members = get_po_members(conn, po_name)
-                            if members:
-                                portchannels[po_name] = members
-                            break
+            # The summary can mention the same Po on several lines; query the
+            # device once per channel and answer repeats from the cache
+            members_cache: Dict[str, List[str]] = {}
+
+            # One findall over the whole blob replaces the per-line strip /
+            # startswith / split / per-token match pipeline
+            for po_name in _RE_PO_LINE.findall(output):
+                if po_name not in members_cache:
+                    members_cache[po_name] = get_po_members(conn, po_name)
+                members = members_cache[po_name]
+                if members and po_name not in portchannels:
+                    portchannels[po_name] = members
             
             return portchannels
         except Exception as e:
             print(f"  ⚠️ Could not get port-channel information: {e}")
             return {}
     
-    def audit_device(self, device_name: str, device_info: Dict[str, str]) -> Optional[DeviceState]:
-        """Perform complete audit of a single device"""
-        print(f"\n🔍 Auditing device: {device_name} ({device_info['host']})")
-        
+    def audit_device(self, device_name: str, device_info: Dict[str, str],
+                     parse_pool: Optional[ProcessPoolExecutor] = None) -> Optional[DeviceState]:
+        """Perform complete audit of a single device
+
+        parse_pool is the per-run process pool audit_all_devices shares
+        across devices; without one, ports are always parsed inline.
+        """
+        # Destructure once; these are re-read on the hot path when audits
+        # run in parallel
+        host = device_info['host']
+        device_type = device_info.get('device_type', 'cisco_ios')
+        print(f"\n🔍 Auditing device: {device_name} ({host})")
+
         username, password = self.credentials
-        conn, _, _ = connect_with_fallback(device_info['host'], username, password)
-        
+        conn = self.pool.get(host, username, password)
+
         if not conn:
             print(f"❌ Failed to connect to {device_name}")
             return None
@@ -282,15 +521,48 @@ class NetworkAuditor:
             # Get all interfaces
             interfaces = self.get_device_ports(conn)
             print(f"  📊 Found {len(interfaces)} interfaces")
-            
+
+            # Fetch device-wide output once and slice it per interface, so the
+            # per-port loop below runs entirely in memory (3 round trips total
+            # instead of 3 per interface)
+            running_config = conn.send_command("show running-config", read_timeout=60, cmd_verify=False)
+            status_output = conn.send_command("show interfaces status", read_timeout=30, cmd_verify=False)
+            switchport_output = conn.send_command("show interfaces switchport", read_timeout=30, cmd_verify=False)
+            config_slices = self._split_config_by_interface(running_config)
+            switchport_slices = self._split_switchport_by_interface(switchport_output)
+            status_map = self._parse_status_table(status_output)
+
             # Get detailed config for each interface
-            ports = {}
+            parse_args = []
             for interface in interfaces:
+                short_name = _short_interface_name(interface)
+                parse_args.append((
+                    interface,
+                    switchport_slices.get(interface) or switchport_slices.get(short_name, ""),
+                    status_map.get(interface) or status_map.get(short_name),
+                    config_slices.get(interface, "")
+                ))
+
+            ports = {}
+            if parse_pool is not None and len(parse_args) >= _PARALLEL_PARSE_THRESHOLD:
+                # Pure string parsing spreads across cores on big chassis;
+                # chunked map amortizes the per-task pickling overhead
                 try:
-                    ports[interface] = self.get_port_config(conn, interface)
+                    parsed = parse_pool.map(_parse_port_config_args, parse_args,
+                                            chunksize=32)
+                    for args, port_config in zip(parse_args, parsed):
+                        ports[args[0]] = port_config
                 except Exception as e:
-                    print(f"  ⚠️ Error getting config for {interface}: {e}")
-                    continue
+                    print(f"  ⚠️ Parallel parse failed for {device_name}, "
+                          f"parsing inline: {e}")
+                    ports = {}
+            if not ports:
+                for args in parse_args:
+                    try:
+                        ports[args[0]] = self.get_port_config(*args)
+                    except Exception as e:
+                        print(f"  ⚠️ Error getting config for {args[0]}: {e}")
+                        continue
             
             # Get VLANs
             vlans = self.get_device_vlans(conn)
@@ -302,8 +574,8 @@ class NetworkAuditor:
             
             device_state = DeviceState(
                 hostname=hostname,
-                ip_address=device_info['host'],
-                device_type=device_info.get('device_type', 'cisco_ios'),
+                ip_address=host,
+                device_type=device_type,
                 timestamp=datetime.now().isoformat(),
                 ports=ports,
                 vlans=vlans,
@@ -317,52 +589,297 @@ class NetworkAuditor:
             print(f"❌ Error auditing {device_name}: {e}")
             return None
         finally:
-            conn.disconnect()
+            # Session goes back to the pool so a follow-up audit reuses it
+            self.pool.release(host, username, conn)
     
-    def audit_all_devices(self) -> Dict[str, DeviceState]:
-        """Audit all devices in the inventory"""
+    def audit_interface(self, device_name: str, interface: str) -> Optional[PortConfig]:
+        """Audit a single interface without pulling full device state
+
+        Issues only the per-interface commands (running config, switchport,
+        status) so validating one changed port costs three small round trips
+        instead of a full-device audit.
+        """
+        device_info = self.devices.get(device_name)
+        if not device_info:
+            print(f"❌ Unknown device: {device_name}")
+            return None
+
+        host = device_info['host']
+        username, password = self.credentials
+        conn = self.pool.get(host, username, password)
+
+        if not conn:
+            print(f"❌ Failed to connect to {device_name}")
+            return None
+
+        try:
+            print(f"  📋 Re-auditing {device_name}:{interface}...")
+            config_output = conn.send_command(
+                f"show running-config interface {interface}", read_timeout=30, cmd_verify=False)
+            switchport_output = conn.send_command(
+                f"show interfaces {interface} switchport", read_timeout=30, cmd_verify=False)
+            status_output = conn.send_command(
+                f"show interfaces {interface} status", read_timeout=30, cmd_verify=False)
+        except Exception as e:
+            print(f"❌ Error auditing {device_name}:{interface}: {e}")
+            return None
+        finally:
+            self.pool.release(host, username, conn)
+
+        status_map = self._parse_status_table(status_output)
+        status_entry = status_map.get(interface) or status_map.get(_short_interface_name(interface))
+        return _parse_port_config(interface, switchport_output, status_entry, config_output)
+
+    def refresh_device_status(self, device_name: str, device_state: DeviceState) -> DeviceState:
+        """Overlay a fresh status-table sweep on a previously audited state
+
+        One 'show interfaces status' round trip catches operational flaps and
+        access-VLAN moves on every port without re-fetching the running
+        config. Returns the previous state untouched if the device is
+        unreachable.
+        """
+        device_info = self.devices.get(device_name)
+        if not device_info:
+            return device_state
+
+        host = device_info['host']
+        username, password = self.credentials
+        conn = self.pool.get(host, username, password)
+
+        if not conn:
+            print(f"⚠️ Cannot refresh status for {device_name}, keeping previous state")
+            return device_state
+
+        try:
+            status_output = conn.send_command("show interfaces status", read_timeout=30, cmd_verify=False)
+        except Exception as e:
+            print(f"⚠️ Error refreshing status for {device_name}: {e}")
+            return device_state
+        finally:
+            self.pool.release(host, username, conn)
+
+        status_map = self._parse_status_table(status_output)
+        ports = dict(device_state.ports)
+        for interface, port in ports.items():
+            entry = status_map.get(interface) or status_map.get(_short_interface_name(interface))
+            if not entry:
+                continue
+            updates = {}
+            if entry[0] != port.operational_status:
+                updates['operational_status'] = entry[0]
+            # The status table's VLAN column exposes access-VLAN moves cheaply
+            if entry[1].isdecimal() and entry[1] != port.access_vlan:
+                updates['access_vlan'] = entry[1]
+            if updates:
+                ports[interface] = replace(port, **updates)
+
+        return DeviceState(
+            hostname=device_state.hostname,
+            ip_address=device_state.ip_address,
+            device_type=device_state.device_type,
+            timestamp=datetime.now().isoformat(),
+            ports=ports,
+            vlans=device_state.vlans,
+            portchannels=device_state.portchannels
+        )
+
+    def audit_all_devices(self, close_pool: bool = True) -> Dict[str, DeviceState]:
+        """Audit all devices in the inventory
+
+        Pass close_pool=False when another audit will follow shortly, so the
+        pooled SSH sessions survive for it to reuse.
+        """
         print(f"🚀 Starting network audit of {len(self.devices)} devices...")
-        
+
+        # Each audit_device call opens its own SSH session, so devices can be
+        # audited concurrently; total runtime drops from the sum of per-device
+        # latencies to roughly the slowest device
         results = {}
-        for device_name, device_info in self.devices.items():
-            state = self.audit_device(device_name, device_info)
-            if state:
-                results[device_name] = state
-        
+        max_workers = min(32, len(self.devices)) or 1
+
+        # One process pool shared by every device audit in this run. Its
+        # workers are spawned here, while the process is still effectively
+        # single-threaded — letting each audit thread build its own pool
+        # would repeat the startup cost per device and fork from a heavily
+        # threaded process, which can deadlock in the children
+        cpu_workers = os.cpu_count() or 1
+        parse_pool = ProcessPoolExecutor(max_workers=cpu_workers)
+        # Workers are forked lazily on demand; prime them all up front
+        list(parse_pool.map(int, range(cpu_workers), chunksize=1))
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.audit_device, device_name, device_info,
+                                    parse_pool): device_name
+                    for device_name, device_info in self.devices.items()
+                }
+                for future in as_completed(futures):
+                    device_name = futures[future]
+                    try:
+                        state = future.result()
+                    except Exception as e:
+                        print(f"❌ Error auditing {device_name}: {e}")
+                        continue
+                    if state:
+                        results[device_name] = state
+        finally:
+            parse_pool.shutdown()
+
+        if close_pool:
+            self.pool.close_all()
         print(f"\n📊 Audit completed: {len(results)}/{len(self.devices)} devices successful")
         return results
     
-    def save_audit_results(self, results: Dict[str, DeviceState], output_file: str = None):
-        """Save audit results to JSON file"""
+    def save_audit_results(self, results: Dict[str, DeviceState], output_file: str = None,
+                           full: bool = False, pretty: bool = False):
+        """Save audit results to JSON file
+
+        When a baseline snapshot exists and jsonpatch is available, only the
+        RFC 6902 diff against the baseline is written (most ports never
+        change between audits, so patches stay tiny). Pass full=True to
+        force a fresh full snapshot and reset the baseline.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        baseline_path = Path(output_file).parent / "baseline.json" if output_file \
+            else Path("baseline.json")
+        incremental = jsonpatch is not None and not full and baseline_path.exists()
         if not output_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"network_audit_{timestamp}.json"
-        
-        # Convert to serializable format
-        serializable_results = {}
-        for device_name, state in results.items():
-            device_dict = asdict(state)
-            # Convert PortConfig objects to dicts
-            device_dict['ports'] = {k: asdict(v) for k, v in state.ports.items()}
-            serializable_results[device_name] = device_dict
-        
+            suffix = "patch.json" if incremental else "json.gz"
+            output_file = f"network_audit_{timestamp}.{suffix}"
+        elif incremental and not output_file.endswith('.patch.json'):
+            # A patch is a JSON list, not a snapshot; keep the marker suffix
+            # on caller-named outputs too so readers can tell them apart
+            stem = output_file[:-5] if output_file.endswith('.json') else output_file
+            output_file = f"{stem}.patch.json"
+
+        # Resolve the absolute path once instead of re-statting per use
         output_path = Path(output_file)
-        with open(output_path, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
-        
-        print(f"💾 Audit results saved to: {output_path.absolute()}")
-        return str(output_path.absolute())
+        abs_path = str(output_path.absolute())
+
+        # Indented output is only for human review; compact mode halves the
+        # write time and file size for machine consumers
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 if pretty else 0
+            dumps = lambda obj: orjson.dumps(obj, option=options)
+            loads = orjson.loads
+        else:
+            indent = 2 if pretty else None
+            separators = None if pretty else (",", ":")
+            dumps = lambda obj: json.dumps(obj, indent=indent, separators=separators).encode()
+            loads = json.loads
+
+        if incremental:
+            # Patch generation needs both full trees in memory
+            serializable_results = {
+                device_name: self._serializable_device(state)
+                for device_name, state in results.items()
+            }
+            baseline = loads(baseline_path.read_bytes())
+            patch = jsonpatch.make_patch(baseline, serializable_results).patch
+            with open(output_path, 'wb') as f:
+                f.write(dumps(patch))
+            print(f"💾 Audit patch ({len(patch)} ops) saved to: {abs_path}")
+        else:
+            # Content-addressed skip: devices whose hash matches the last
+            # audit get a tiny {"ref": hash} pointer in the snapshot instead
+            # of their full state (the baseline always keeps the full copy)
+            index_path = output_path.parent / "audit_index.json"
+            try:
+                audit_index = loads(index_path.read_bytes())
+            except (FileNotFoundError, ValueError):
+                audit_index = {}
+
+            # Refs must stay resolvable after later saves rewrite the
+            # baseline, so every device state is also stored content-
+            # addressed under audit_states/<hash>.json. Hashes never
+            # collide in practice and an existing file is already the
+            # right bytes, so states are written at most once
+            states_dir = output_path.parent / "audit_states"
+            states_dir.mkdir(exist_ok=True)
+
+            # Stream one device at a time instead of holding the whole result
+            # dict plus its serialized form in memory; the snapshot and the
+            # baseline receive the bytes as they are produced. The baseline
+            # and index go through temp files renamed into place, so savers
+            # running concurrently (e.g. parallel test workers sharing a
+            # CWD) never observe a half-written file
+            baseline_tmp = baseline_path.with_name(f"{baseline_path.name}.tmp{os.getpid()}")
+            with _open_audit(output_path, 'wb') as out, open(baseline_tmp, 'wb') as base:
+                out.write(b'{\n')
+                base.write(b'{\n')
+                first = True
+                for device_name, state in results.items():
+                    flat = self._serializable_device(state)
+                    state_hash = _state_hash(flat)
+                    key = dumps(device_name) + b': '
+                    payload = dumps(flat)
+                    if not first:
+                        out.write(b',\n')
+                        base.write(b',\n')
+                    first = False
+                    base.write(key + payload)
+                    state_path = states_dir / f"{state_hash}.json"
+                    if not state_path.exists():
+                        state_tmp = states_dir / f"{state_hash}.json.tmp{os.getpid()}"
+                        state_tmp.write_bytes(payload)
+                        os.replace(state_tmp, state_path)
+                    if audit_index.get(device_name) == state_hash:
+                        out.write(key + dumps({'ref': state_hash}))
+                    else:
+                        out.write(key + payload)
+                    audit_index[device_name] = state_hash
+                out.write(b'\n}\n')
+                base.write(b'\n}\n')
+            os.replace(baseline_tmp, baseline_path)
+            index_tmp = index_path.with_name(f"{index_path.name}.tmp{os.getpid()}")
+            index_tmp.write_bytes(dumps(audit_index))
+            os.replace(index_tmp, index_path)
+            print(f"💾 Audit results saved to: {abs_path}")
+        return abs_path
+
+    @staticmethod
+    def _serializable_device(state: DeviceState) -> Dict[str, Any]:
+        """Flatten one DeviceState into plain dicts without asdict's deepcopy"""
+        device_dict = {f.name: getattr(state, f.name) for f in fields(state)}
+        # Convert PortConfig objects to dicts
+        device_dict['ports'] = {
+            k: {f.name: getattr(v, f.name) for f in fields(v)}
+            for k, v in state.ports.items()
+        }
+        return device_dict
     
     def compare_audits(self, before_file: str, after_file: str) -> Dict[str, Any]:
         """Compare two audit files and report differences"""
         print(f"🔍 Comparing audits: {before_file} vs {after_file}")
-        
-        with open(before_file, 'r') as f:
-            before_data = json.load(f)
-        
-        with open(after_file, 'r') as f:
-            after_data = json.load(f)
-        
+
+        loads = orjson.loads if orjson is not None else json.loads
+        with _open_audit(before_file, 'rb') as f:
+            before_data = self._resolve_audit(loads(f.read()), before_file)
+
+        with _open_audit(after_file, 'rb') as f:
+            after_data = self._resolve_audit(loads(f.read()), after_file)
+
+        return self.compare_audits_objects(before_data, after_data)
+
+    def compare_audits_objects(self, before_data: Dict[str, Any],
+                               after_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compare two in-memory audits and report differences
+
+        Accepts either the plain-dict form stored on disk or live
+        Dict[str, DeviceState] audits; DeviceState entries are flattened
+        directly, so callers holding audits in memory skip the JSON
+        round trip entirely.
+        """
+        before_data = {
+            name: self._serializable_device(state) if isinstance(state, DeviceState) else state
+            for name, state in before_data.items()
+        }
+        after_data = {
+            name: self._serializable_device(state) if isinstance(state, DeviceState) else state
+            for name, state in after_data.items()
+        }
+
         differences = {
             'added_devices': [],
             'removed_devices': [],
@@ -389,6 +906,46 @@ class NetworkAuditor:
         
         return differences
     
+    def _resolve_audit(self, data: Any, audit_file: str) -> Dict[str, Any]:
+        """Materialize a patch- or ref-format audit via its baseline"""
+        loads = orjson.loads if orjson is not None else json.loads
+        if isinstance(data, list):
+            if jsonpatch is None:
+                print(f"❌ {audit_file} is an audit patch but jsonpatch is not installed")
+                sys.exit(1)
+            baseline_path = Path(audit_file).parent / "baseline.json"
+            baseline = loads(baseline_path.read_bytes())
+            return jsonpatch.JsonPatch(data).apply(baseline)
+
+        # Unchanged devices are stored as {"ref": hash} pointers. The
+        # content-addressed store is authoritative — the baseline only
+        # holds the *latest* state, so a baseline entry is trusted for an
+        # older ref only when its hash still matches
+        audit_dir = Path(audit_file).parent
+        baseline = None
+        resolved = {}
+        for device_name, entry in data.items():
+            if isinstance(entry, dict) and set(entry) == {'ref'}:
+                state_path = audit_dir / "audit_states" / f"{entry['ref']}.json"
+                try:
+                    resolved[device_name] = loads(state_path.read_bytes())
+                    continue
+                except (FileNotFoundError, ValueError):
+                    pass
+                if baseline is None:
+                    baseline = loads((audit_dir / "baseline.json").read_bytes())
+                full = baseline.get(device_name)
+                if full is not None and _state_hash(full) == entry['ref']:
+                    resolved[device_name] = full
+                else:
+                    print(f"⚠️ {device_name}: ref {entry['ref']} has no stored "
+                          f"state and the baseline no longer matches it; "
+                          f"leaving the device unresolved")
+                    resolved[device_name] = entry
+            else:
+                resolved[device_name] = entry
+        return resolved
+
     def _compare_device_states(self, before: Dict, after: Dict) -> Dict[str, Any]:
         """Compare states of a single device"""
         changes = {
@@ -420,18 +977,28 @@ class NetworkAuditor:
                 port_changes['status'] = 'removed'
                 port_changes['config'] = before_ports[port]
             else:
-                # Compare port configurations
+                # Compare port configurations: the symmetric difference of
+                # item views yields every changed pair in one C-level pass and
+                # covers keys present on either side; fall back to a key walk
+                # if any value is unhashable
                 before_config = before_ports[port]
                 after_config = after_ports[port]
-                
-                for key in before_config:
-                    if before_config[key] != after_config.get(key):
-                        if 'config_changes' not in port_changes:
-                            port_changes['config_changes'] = {}
-                        port_changes['config_changes'][key] = {
-                            'before': before_config[key],
+
+                try:
+                    changed_keys = {k for k, _ in before_config.items() ^ after_config.items()}
+                except TypeError:
+                    changed_keys = {
+                        k for k in before_config.keys() | after_config.keys()
+                        if before_config.get(k) != after_config.get(k)
+                    }
+                if changed_keys:
+                    port_changes['config_changes'] = {
+                        key: {
+                            'before': before_config.get(key),
                             'after': after_config.get(key)
                         }
+                        for key in changed_keys
+                    }
             
             if port_changes:
                 changes['port_changes'][port] = port_changes
@@ -443,44 +1010,49 @@ class NetworkAuditor:
     
     def generate_report(self, audit_data: Dict[str, DeviceState], output_file: str = None):
         """Generate a human-readable report"""
+        now = datetime.now()
         if not output_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"network_report_{timestamp}.md"
-        
+            output_file = f"network_report_{now.strftime('%Y%m%d_%H%M%S')}.md"
+
+        # Build the report in memory and flush once; dozens of tiny f.write
+        # calls each pay a Python-to-C transition
+        buf: List[str] = []
+        buf.append("# Network Audit Report\n\n")
+        buf.append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        buf.append(f"## Summary\n\n")
+        buf.append(f"- **Devices Audited**: {len(audit_data)}\n")
+
+        total_ports = sum(len(device.ports) for device in audit_data.values())
+        buf.append(f"- **Total Ports**: {total_ports}\n")
+
+        total_vlans = sum(len(device.vlans) for device in audit_data.values())
+        buf.append(f"- **Total VLANs**: {total_vlans}\n\n")
+
+        for device_name, device_state in audit_data.items():
+            buf.append(f"## Device: {device_name}\n\n")
+            buf.append(f"- **Hostname**: {device_state.hostname}\n")
+            buf.append(f"- **IP Address**: {device_state.ip_address}\n")
+            buf.append(f"- **Device Type**: {device_state.device_type}\n")
+            buf.append(f"- **Audit Time**: {device_state.timestamp}\n")
+            buf.append(f"- **Ports**: {len(device_state.ports)}\n")
+            buf.append(f"- **VLANs**: {len(device_state.vlans)}\n")
+            buf.append(f"- **Port-Channels**: {len(device_state.portchannels)}\n\n")
+
+            # Port summary
+            if device_state.ports:
+                buf.append(f"### Port Summary\n\n")
+                buf.append("| Interface | Status | Mode | Access VLAN | Voice VLAN |\n")
+                buf.append("|-----------|--------|------|-------------|------------|\n")
+
+                for port_name, port_config in sorted(device_state.ports.items()):
+                    buf.append(f"| {port_config.interface} | {port_config.operational_status} | {port_config.mode} | {port_config.access_vlan} | {port_config.voice_vlan} |\n")
+
+                buf.append("\n")
+
         with open(output_file, 'w') as f:
-            f.write("# Network Audit Report\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write(f"## Summary\n\n")
-            f.write(f"- **Devices Audited**: {len(audit_data)}\n")
-            
-            total_ports = sum(len(device.ports) for device in audit_data.values())
-            f.write(f"- **Total Ports**: {total_ports}\n")
-            
-            total_vlans = sum(len(device.vlans) for device in audit_data.values())
-            f.write(f"- **Total VLANs**: {total_vlans}\n\n")
-            
-            for device_name, device_state in audit_data.items():
-                f.write(f"## Device: {device_name}\n\n")
-                f.write(f"- **Hostname**: {device_state.hostname}\n")
-                f.write(f"- **IP Address**: {device_state.ip_address}\n")
-                f.write(f"- **Device Type**: {device_state.device_type}\n")
-                f.write(f"- **Audit Time**: {device_state.timestamp}\n")
-                f.write(f"- **Ports**: {len(device_state.ports)}\n")
-                f.write(f"- **VLANs**: {len(device_state.vlans)}\n")
-                f.write(f"- **Port-Channels**: {len(device_state.portchannels)}\n\n")
-                
-                # Port summary
-                if device_state.ports:
-                    f.write(f"### Port Summary\n\n")
-                    f.write("| Interface | Status | Mode | Access VLAN | Voice VLAN |\n")
-                    f.write("|-----------|--------|------|-------------|------------|\n")
-                    
-                    for port_name, port_config in sorted(device_state.ports.items()):
-                        f.write(f"| {port_config.interface} | {port_config.operational_status} | {port_config.mode} | {port_config.access_vlan} | {port_config.voice_vlan} |\n")
-                    
-                    f.write("\n")
-        
+            f.writelines(buf)
+
         print(f"📄 Report generated: {output_file}")
         return output_file
 
@@ -496,6 +1068,10 @@ def main():
                        help="Generate human-readable report")
     parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
                        help="Compare two audit files")
+    parser.add_argument("--full", action="store_true",
+                       help="Write a full snapshot and reset the patch baseline")
+    parser.add_argument("--pretty", action="store_true",
+                       help="Indent the audit JSON for human review")
     
     args = parser.parse_args()
     
@@ -519,7 +1095,8 @@ def main():
         sys.exit(1)
     
     # Save results
-    output_file = auditor.save_audit_results(results, args.output)
+    output_file = auditor.save_audit_results(results, args.output, full=args.full,
+                                             pretty=args.pretty)
     
     # Generate report if requested
     if args.report:
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Shared Helpers for VLAN Change Testing
+
+Utility functions shared by the VLAN test framework and CI scripts:
+inventory loading, input validation, CLI output parsing, and report
+helpers. Kept free of device I/O so they stay cheap to exercise.
+"""
+
+import json
+import re
+import sys
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from datetime import datetime
+
+try:
+    import orjson  # optional: much faster JSON encoding when available
+except ImportError:
+    orjson = None
+
+# Resolved on first YAML load so importing this module (most callers only
+# need the pure parsers) doesn't pay the yaml import. The libyaml-backed
+# CSafeLoader, when PyYAML was built with it, parses large inventories
+# several times faster than the pure-Python SafeLoader.
+_YAML_LOADER = None
+
+# Parsed YAML keyed by path; a file is reparsed only when its mtime moves.
+# Entries are returned as-is, so callers must treat them as read-only.
+_YAML_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+def _load_yaml_cached(path: str) -> Any:
+    """Load a YAML file, reusing the parsed result until the file changes"""
+    global _YAML_LOADER
+    mtime = os.stat(path).st_mtime
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    import yaml
+    if _YAML_LOADER is None:
+        _YAML_LOADER = yaml.CSafeLoader if hasattr(yaml, 'CSafeLoader') else yaml.SafeLoader
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    _YAML_CACHE[path] = (mtime, data)
+    return data
+
+def load_device_inventory(devices_file: str = "inventory/devices.yml") -> Dict[str, Dict[str, str]]:
+    """Load the device inventory from YAML"""
+    data = _load_yaml_cached(devices_file)
+    return data.get('devices', {}) if data else {}
+
+def load_test_targets(targets_file: str = "inventory/targets.yml") -> Dict[str, Any]:
+    """Load the test target configuration from YAML"""
+    return _load_yaml_cached(targets_file) or {}
+
+# All accepted interface spellings collapsed into one anchored alternation,
+# compiled once at import
+_IFACE_RE = re.compile(
+    r'^(?:GigabitEthernet|FastEthernet|TenGigabitEthernet|Ethernet|Gi|Fa|Te|Et)'
+    r'\d+/\d+(?:/\d+)?$',
+    re.IGNORECASE
+)
+
+def validate_interface_name(interface: str) -> bool:
+    """Check whether a string looks like a physical interface name"""
+    return _IFACE_RE.match(interface) is not None
+
+def validate_vlan_id(vlan_id: str) -> bool:
+    """Check whether a string is a valid VLAN ID (1-4094)"""
+    # isdecimal rejects malformed input without the cost of a raised
+    # ValueError, and only passes strings int() is guaranteed to accept
+    return isinstance(vlan_id, str) and vlan_id.isdecimal() and 1 <= int(vlan_id) <= 4094
+
+# Shorthand prefixes matched in one anchored probe; the digit lookahead
+# keeps full spellings like 'GigabitEthernet0/1' from being re-expanded
+_IFACE_NORMALIZE_RE = re.compile(r'^(Gi|Fa|Te|Et)(?=\d)')
+_EXPAND = {
+    'Gi': 'GigabitEthernet',
+    'Fa': 'FastEthernet',
+    'Te': 'TenGigabitEthernet',
+    'Et': 'Ethernet',
+}
+
+def normalize_interface_name(interface: str) -> str:
+    """Expand shorthand interface names (Gi0/1 -> GigabitEthernet0/1)"""
+    m = _IFACE_NORMALIZE_RE.match(interface)
+    return _EXPAND[m.group(1)] + interface[2:] if m else interface
+
+# Matches one line at a time so parsers can walk CLI output without the
+# list allocation splitlines() makes for the whole buffer
+_LINE_RE = re.compile(r'[^\r\n]+')
+
+# Dispatch table for running-config lines, keyed on the leading 1-3 tokens;
+# one dict probe replaces the chain of startswith tests per line
+_CFG_DISPATCH = {
+    ('switchport', 'access', 'vlan'):
+        lambda line, parts, config: config.__setitem__('access_vlan', parts[3]),
+    ('switchport', 'voice', 'vlan'):
+        lambda line, parts, config: config.__setitem__('voice_vlan', parts[3]),
+    ('switchport', 'mode'):
+        lambda line, parts, config: config.__setitem__('mode', parts[2]),
+    ('description',):
+        lambda line, parts, config: config.__setitem__('description', line[len('description '):]),
+    ('speed',):
+        lambda line, parts, config: config.__setitem__('speed', parts[1]),
+    ('duplex',):
+        lambda line, parts, config: config.__setitem__('duplex', parts[1]),
+    ('spanning-tree', 'portfast'):
+        lambda line, parts, config: config.__setitem__('portfast', True),
+    ('shutdown',):
+        lambda line, parts, config: config.__setitem__('shutdown', True),
+}
+
+def parse_interface_config(config_text: str) -> Dict[str, Any]:
+    """Parse 'show running-config interface X' output into a config dict"""
+    config = {
+        'access_vlan': '1',
+        'voice_vlan': 'none',
+        'mode': 'unknown',
+        'description': '',
+        'speed': 'auto',
+        'duplex': 'auto',
+        'portfast': False,
+        'shutdown': False
+    }
+
+    # Iterate lines in place rather than materializing a splitlines() list
+    for line_match in _LINE_RE.finditer(config_text):
+        line = line_match.group().strip()
+        if not line:
+            continue
+        parts = line.split(None, 3)
+        for width in (3, 2, 1):
+            handler = _CFG_DISPATCH.get(tuple(parts[:width]))
+            if handler:
+                handler(line, parts, config)
+                break
+
+    return config
+
+# The three switchport fields captured in one multiline pass; the map
+# translates the matched label to its config key
+_SWP_RE = re.compile(r'^\s*(Administrative Mode|Access Mode VLAN|Voice VLAN):\s*([^\r\n]+?)\s*$', re.M)
+_SWP_MAP = {
+    'Administrative Mode': 'mode',
+    'Access Mode VLAN': 'access_vlan',
+    'Voice VLAN': 'voice_vlan'
+}
+
+def parse_switchport_output(output: str) -> Dict[str, str]:
+    """Parse 'show interface X switchport' output"""
+    config = {
+        'mode': 'unknown',
+        'access_vlan': '1',
+        'voice_vlan': 'none'
+    }
+
+    for m in _SWP_RE.finditer(output):
+        label, value = m.group(1), m.group(2)
+        if label == 'Administrative Mode':
+            # Last token, matching network_audit._parse_port_config:
+            # 'static access' -> 'access'
+            config['mode'] = value.split()[-1]
+        else:
+            # VLAN lines may carry a name parenthetical: '20 (DATA)' -> '20'
+            config[_SWP_MAP[label]] = value.split()[0]
+
+    return config
+
+def check_vlan_exists(output: str, vlan_id: str) -> bool:
+    """Check 'show vlan brief' output for a VLAN ID"""
+    # One anchored multiline search in C instead of a per-line Python scan
+    return re.search(rf'(?m)^\s*{re.escape(vlan_id)}\s', output) is not None
+
+def compare_port_configs(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Return the fields that differ between two port config dicts"""
+    differences = {
+        key: {'before': before[key], 'after': after[key]}
+        for key in before.keys() & after.keys()
+        if before[key] != after[key]
+    }
+    # Keys present on only one side always count as a difference
+    for key in before.keys() ^ after.keys():
+        differences[key] = {
+            'before': before.get(key, 'NOT_SET'),
+            'after': after.get(key, 'NOT_SET')
+        }
+    return differences
+
+# Error counters pulled from 'show interface' output in one scan; the map
+# translates the matched counter label to its warning name
+_ERROR_RE = re.compile(r'(\d+)\s+(input errors|output errors|CRC|collisions)')
+_ERROR_NAME_MAP = {
+    'input errors': 'input_errors',
+    'output errors': 'output_errors',
+    'CRC': 'crc_errors',
+    'collisions': 'collisions'
+}
+
+# Case-insensitive search avoids lowercasing the whole multi-KB output
+_LINK_STATE_RE = re.compile(r'line protocol is (up|down)', re.IGNORECASE)
+
+def validate_port_connectivity(interface_output: str) -> Dict[str, Any]:
+    """Inspect 'show interface X' output for link state and error counters"""
+    result = {
+        'link_status': 'unknown',
+        'warnings': []
+    }
+
+    m = _LINK_STATE_RE.search(interface_output)
+    if m:
+        result['link_status'] = m.group(1).lower()
+        if result['link_status'] == 'down':
+            result['warnings'].append('Line protocol is down')
+
+    for m in _ERROR_RE.finditer(interface_output):
+        count = int(m.group(1))
+        if count:
+            result['warnings'].append(f"{_ERROR_NAME_MAP[m.group(2)]}: {count}")
+
+    return result
+
+_RULE = '=' * 60
+_DIVIDER = '-' * 60
+
+def format_test_summary(test_results: Dict[str, Any]) -> str:
+    """Format a test-result dict as a console summary block"""
+    errors = test_results.get('errors', [])
+    warnings = test_results.get('warnings', [])
+    error_block = (
+        f"{_DIVIDER}\nErrors:\n" + ''.join(f"  ❌ {error}\n" for error in errors)
+        if errors else ''
+    )
+    warning_block = (
+        f"{_DIVIDER}\nWarnings:\n" + ''.join(f"  ⚠️ {warning}\n" for warning in warnings)
+        if warnings else ''
+    )
+
+    return (
+        f"{_RULE}\n"
+        f"NETWORK VLAN CHANGE TEST SUMMARY\n"
+        f"{_RULE}\n"
+        f"Test ID:         {test_results.get('test_id', 'unknown')}\n"
+        f"Start Time:      {test_results.get('start_time', 'unknown')}\n"
+        f"End Time:        {test_results.get('end_time', 'unknown')}\n"
+        f"{_DIVIDER}\n"
+        f"Target Device:   {test_results.get('target_device', 'n/a')}\n"
+        f"Interface:       {test_results.get('target_interface', 'n/a')}\n"
+        f"Original VLAN:   {test_results.get('original_vlan', 'n/a')}\n"
+        f"Target VLAN:     {test_results.get('target_vlan', 'n/a')}\n"
+        f"{_DIVIDER}\n"
+        f"Result:          {'✅ PASSED' if test_results.get('success') else '❌ FAILED'}\n"
+        f"Changes Applied: {'yes' if test_results.get('changes_applied') else 'no'}\n"
+        f"Rollback:        {'yes' if test_results.get('rollback_performed') else 'no'}\n"
+        f"{error_block}"
+        f"{warning_block}"
+        f"{_RULE}"
+    )
+
+# Metadata fields that never change between reports, built once
+_REPORT_METADATA_STATIC = {
+    'report_type': 'network_vlan_test',
+    'version': '1.0'
+}
+
+def create_test_report_json(test_results: Dict[str, Any],
+                            pre_audit: Dict[str, Any],
+                            post_audit: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble the JSON test report structure"""
+    now_iso = datetime.now().isoformat()
+    pre_keys = list(pre_audit)
+    post_keys = list(post_audit)
+    return {
+        'metadata': {**_REPORT_METADATA_STATIC, 'generated': now_iso},
+        'test_results': test_results,
+        'pre_change_audit': {
+            'timestamp': now_iso,
+            'device_count': len(pre_keys),
+            'devices': pre_keys
+        },
+        'post_change_audit': {
+            'timestamp': now_iso,
+            'device_count': len(post_keys),
+            'devices': post_keys
+        }
+    }
+
+def save_json_report(report_data: Dict[str, Any], output_file: str) -> str:
+    """Write a JSON report to disk"""
+    if orjson is not None:
+        payload = orjson.dumps(report_data, option=orjson.OPT_INDENT_2, default=str)
+    else:
+        payload = json.dumps(report_data, indent=2, default=str).encode()
+    with open(output_file, 'wb') as f:
+        f.write(payload)
+    return output_file
+
+def validate_test_prerequisites(devices: Dict[str, Dict[str, str]],
+                                target_config: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """Validate that a test target configuration can run against the inventory"""
+    errors = []
+
+    target = target_config.get('target') or {}
+    target_device = target.get('device')
+    target_interface = target.get('interface')
+    test_vlan = target_config.get('test_vlan')
+
+    # Run the validators only when a value is present; missing fields are
+    # already errors and need no further checking
+    if not target_device:
+        errors.append("Target device must be specified")
+    elif target_device not in devices:
+        errors.append(f"Target device '{target_device}' not found in inventory")
+
+    if not target_interface:
+        errors.append("Target interface must be specified")
+    elif not validate_interface_name(target_interface):
+        errors.append(f"Invalid interface name: {target_interface}")
+
+    if test_vlan is None:
+        errors.append("Test VLAN must be specified")
+    elif not validate_vlan_id(str(test_vlan)):
+        errors.append(f"Invalid VLAN ID: {test_vlan}")
+
+    return len(errors) == 0, errors
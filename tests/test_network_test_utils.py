@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared VLAN-test helpers
+
+These helpers are pure functions over strings and dicts (no device I/O),
+so they run anywhere — no lab, no credentials, no inventory files.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from tests.network_test_utils import (
+    validate_interface_name,
+    validate_vlan_id,
+    normalize_interface_name,
+    parse_interface_config,
+    parse_switchport_output,
+    check_vlan_exists,
+    compare_port_configs,
+    validate_port_connectivity,
+    format_test_summary,
+    validate_test_prerequisites,
+)
+
+_RUNNING_CONFIG = """\
+interface GigabitEthernet1/0/5
+ description Uplink to printer
+ switchport mode access
+ switchport access vlan 20
+ switchport voice vlan 150
+ speed 100
+ duplex full
+ spanning-tree portfast
+end
+"""
+
+_SWITCHPORT_OUTPUT = """\
+Name: Gi1/0/5
+Switchport: Enabled
+Administrative Mode: static access
+Operational Mode: static access
+Access Mode VLAN: 20 (DATA)
+Voice VLAN: 150 (VOICE)
+"""
+
+_SHOW_INTERFACE_UP = """\
+GigabitEthernet1/0/5 is up, line protocol is up (connected)
+  5 minute input rate 1000 bits/sec, 2 packets/sec
+  0 input errors, 0 CRC, 0 frame
+  0 output errors, 0 collisions, 1 interface resets
+"""
+
+_SHOW_INTERFACE_DOWN = """\
+GigabitEthernet1/0/5 is down, line protocol is down (notconnect)
+  42 input errors, 7 CRC, 0 frame
+  3 output errors, 12 collisions, 1 interface resets
+"""
+
+def test_validate_interface_name():
+    assert validate_interface_name("GigabitEthernet1/0/5")
+    assert validate_interface_name("Gi1/0/5")
+    assert validate_interface_name("FastEthernet0/1")
+    assert not validate_interface_name("Vlan100")
+    assert not validate_interface_name("GigabitEthernet")
+    assert not validate_interface_name("")
+
+def test_validate_vlan_id():
+    assert validate_vlan_id("1")
+    assert validate_vlan_id("4094")
+    assert not validate_vlan_id("0")
+    assert not validate_vlan_id("4095")
+    assert not validate_vlan_id("-1")
+    assert not validate_vlan_id("twenty")
+    assert not validate_vlan_id("")
+
+def test_normalize_interface_name():
+    assert normalize_interface_name("Gi1/0/5") == "GigabitEthernet1/0/5"
+    assert normalize_interface_name("Fa0/1") == "FastEthernet0/1"
+    assert normalize_interface_name("Te1/1/1") == "TenGigabitEthernet1/1/1"
+    # Full spellings pass through untouched
+    assert normalize_interface_name("GigabitEthernet1/0/5") == "GigabitEthernet1/0/5"
+
+def test_parse_interface_config():
+    config = parse_interface_config(_RUNNING_CONFIG)
+    assert config['access_vlan'] == '20'
+    assert config['voice_vlan'] == '150'
+    assert config['mode'] == 'access'
+    assert config['description'] == 'Uplink to printer'
+    assert config['speed'] == '100'
+    assert config['duplex'] == 'full'
+    assert config['portfast'] is True
+    assert config['shutdown'] is False
+
+def test_parse_interface_config_defaults():
+    config = parse_interface_config("interface GigabitEthernet1/0/1\nend")
+    assert config['access_vlan'] == '1'
+    assert config['voice_vlan'] == 'none'
+    assert config['mode'] == 'unknown'
+
+def test_parse_switchport_output():
+    config = parse_switchport_output(_SWITCHPORT_OUTPUT)
+    # Last-token mode semantics, matching network_audit's parser
+    assert config['mode'] == 'access'
+    assert config['access_vlan'] == '20'
+    assert config['voice_vlan'] == '150'
+
+def test_check_vlan_exists():
+    output = (
+        "VLAN Name                             Status    Ports\n"
+        "---- -------------------------------- --------- ----------\n"
+        "1    default                          active    Gi1/0/1\n"
+        "20   DATA                             active    Gi1/0/5\n"
+    )
+    assert check_vlan_exists(output, "20")
+    assert check_vlan_exists(output, "1")
+    assert not check_vlan_exists(output, "2")
+    assert not check_vlan_exists(output, "200")
+
+def test_compare_port_configs():
+    before = {'access_vlan': '20', 'voice_vlan': '150', 'mode': 'access'}
+    after = {'access_vlan': '30', 'voice_vlan': '150', 'portfast': True}
+    diff = compare_port_configs(before, after)
+    assert diff['access_vlan'] == {'before': '20', 'after': '30'}
+    assert diff['mode'] == {'before': 'access', 'after': 'NOT_SET'}
+    assert diff['portfast'] == {'before': 'NOT_SET', 'after': True}
+    assert 'voice_vlan' not in diff
+
+def test_validate_port_connectivity():
+    up = validate_port_connectivity(_SHOW_INTERFACE_UP)
+    assert up['link_status'] == 'up'
+    assert up['warnings'] == []
+
+    down = validate_port_connectivity(_SHOW_INTERFACE_DOWN)
+    assert down['link_status'] == 'down'
+    assert 'Line protocol is down' in down['warnings']
+    assert 'input_errors: 42' in down['warnings']
+    assert 'crc_errors: 7' in down['warnings']
+
+def test_format_test_summary():
+    summary = format_test_summary({
+        'test_id': '20260831_120000',
+        'target_device': 'switch1',
+        'target_interface': 'Gi1/0/5',
+        'original_vlan': '20',
+        'target_vlan': '30',
+        'success': True,
+        'changes_applied': True,
+        'rollback_performed': True,
+        'errors': [],
+        'warnings': ['port flapped once']
+    })
+    assert '✅ PASSED' in summary
+    assert 'switch1' in summary
+    assert 'port flapped once' in summary
+    assert 'Errors:' not in summary
+
+def test_validate_test_prerequisites():
+    devices = {'switch1': {'host': '10.0.0.1'}}
+
+    valid, errors = validate_test_prerequisites(devices, {
+        'target': {'device': 'switch1', 'interface': 'Gi1/0/5'},
+        'test_vlan': 30
+    })
+    assert valid
+    assert errors == []
+
+def test_validate_test_prerequisites_failures():
+    devices = {'switch1': {'host': '10.0.0.1'}}
+
+    valid, errors = validate_test_prerequisites(devices, {
+        'target': {'device': 'switch2', 'interface': 'Vlan100'},
+        'test_vlan': 9999
+    })
+    assert not valid
+    assert "Target device 'switch2' not found in inventory" in errors
+    assert "Invalid interface name: Vlan100" in errors
+    assert "Invalid VLAN ID: 9999" in errors
+
+    valid, errors = validate_test_prerequisites(devices, {})
+    assert not valid
+    assert "Target device must be specified" in errors
+    assert "Target interface must be specified" in errors
+    assert "Test VLAN must be specified" in errors